@@ -1,10 +1,19 @@
 import sys
-# Inject a themed QApplication subclass so the rest of the module can keep using
-# "from PySide6.QtWidgets import QApplication" unchanged while getting a light
-# modern theme with blue accents applied automatically.
-import PySide6.QtWidgets as _qtwidgets
+from functools import lru_cache
+
+from PySide6.QtCore import Qt, QCoreApplication
 from PySide6.QtGui import QColor, QPalette, QIcon
+from PySide6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QPushButton, QFrame, QButtonGroup
+)
 
+from widgets import AnimatedStack, DataTable, TitleBar
+
+# Compiled Qt resources (pyside6-rcc assets.qrc -o assets_rc.py). Importing
+# registers them, so images are served from memory via ":/" paths instead of
+# being opened from disk on every lookup.
+import assets_rc  # noqa: F401
 
 
 # Theme palette/colors
@@ -32,6 +41,14 @@ QFrame#titlebar, QFrame {{
 QLabel {{
     color: {_THEME["text"]};
 }}
+QLabel[role="page-title"] {{
+    font-size: 32px;
+    font-weight: bold;
+}}
+QLabel[role="page-body"] {{
+    font-size: 18px;
+    color: {_THEME["muted"]};
+}}
 
 QPushButton {{
     background-color: transparent;
@@ -48,10 +65,7 @@ QPushButton:pressed {{
     background-color: rgba(30,95,184,0.14);
 }}
 
-# Sidebar styling (applies to nav QFrame and its buttons)
-QFrame {{
-    /* default frame rules */
-}}
+/* Sidebar styling (applies to nav QFrame and its buttons) */
 QFrame[sidebar="true"] {{
     background-color: {_THEME["panel"]};
     border-right: 1px solid {_THEME["border"]};
@@ -67,7 +81,7 @@ QFrame[sidebar="true"] QPushButton:hover {{
     color: {_THEME["accent"]};
 }}
 
-QTableWidget {{
+QTableView {{
     background-color: {_THEME["panel"]};
     color: {_THEME["text"]};
     gridline-color: {_THEME["border"]};
@@ -99,190 +113,24 @@ QScrollBar::handle:hover {{
 }}
 """
 
-class ThemedApplication(_qtwidgets.QApplication):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Prefer Fusion for consistent rendering across platforms
-        try:
-            self.setStyle("Fusion")
-        except Exception:
-            pass
-
-        # Set a light QPalette that matches the stylesheet
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(_THEME["bg"]))
-        palette.setColor(QPalette.WindowText, QColor(_THEME["text"]))
-        palette.setColor(QPalette.Base, QColor(_THEME["panel"]))
-        palette.setColor(QPalette.AlternateBase, QColor(_THEME["table_alt"]))
-        palette.setColor(QPalette.ToolTipBase, QColor(_THEME["panel"]))
-        palette.setColor(QPalette.ToolTipText, QColor(_THEME["text"]))
-        palette.setColor(QPalette.Text, QColor(_THEME["text"]))
-        palette.setColor(QPalette.Button, QColor(_THEME["panel"]))
-        palette.setColor(QPalette.ButtonText, QColor(_THEME["text"]))
-        palette.setColor(QPalette.BrightText, QColor("#ffffff"))
-        palette.setColor(QPalette.Highlight, QColor(_THEME["accent"]))
-        palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
-        self.setPalette(palette)
-
-        # Apply global stylesheet
-        self.setStyleSheet(_GLOBAL_STYLESHEET)
-
-
-# Replace QApplication in PySide6.QtWidgets module so downstream "from ... import QApplication"
-# picks up ThemedApplication automatically.
-_qtwidgets.QApplication = ThemedApplication
-import requests
-from PySide6.QtCore import Qt, QPoint, QPropertyAnimation, QEasingCurve, QRect, QTimer
-from PySide6.QtGui import QColor, QPalette
-from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QStackedWidget, QFrame, QTableWidget, QTableWidgetItem, QMessageBox
-)
-
-class DataTable(QWidget):
-    """
-    A single table widget that can run any SQL query
-    on-demand when a button is pressed.
-    """
-    def __init__(self, title="Data Viewer", endpoint="http://localhost:3000/query"):
-        super().__init__()
-        self.endpoint = endpoint
-
-        # --- Layout setup ---
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(15, 15, 15, 15)
-        layout.setSpacing(10)
-
-        # Title
-        title_label = QLabel(title)
-        layout.addWidget(title_label)
-
-        # Table
-        self.table = QTableWidget()
-        layout.addWidget(self.table)
-
-        # Buttons row
-        button_layout = QHBoxLayout()
-        layout.addLayout(button_layout)
-
-        # Add buttons with predefined queries
-        self.buttons = {
-            "Drumming": "SELECT TOP 10 * FROM dbo.batches",
-            "Ewald": "SELECT TOP 10 * FROM dbo.ewald",
-            "Convo": "SELECT TOP 10 * FROM dbo.convo",
-            "Mixing": "SELECT TOP 10 * FROM dbo.Mixing",
-        }
-
-        for label, query in self.buttons.items():
-            btn = QPushButton(label)
-            btn.clicked.connect(lambda checked, q=query: self.run_query(q))
-            button_layout.addWidget(btn)
-
-        button_layout.addStretch()
-
-    def run_query(self, query: str):
-        """Fetch data from the Node.js bridge and populate the table."""
-        try:
-            res = requests.post(self.endpoint, json={"query": query})
-            res.raise_for_status()
-            data = res.json()
-
-            if not data:
-                self.table.setRowCount(0)
-                self.table.setColumnCount(1)
-                self.table.setHorizontalHeaderLabels(["No data"])
-                return
-
-            columns = list(data[0].keys())
-            self.table.setColumnCount(len(columns))
-            self.table.setRowCount(len(data))
-            self.table.setHorizontalHeaderLabels(columns)
-
-            for row_idx, row in enumerate(data):
-                for col_idx, col_name in enumerate(columns):
-                    val = str(row[col_name])
-                    self.table.setItem(row_idx, col_idx, QTableWidgetItem(val))
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load data:\n{e}")
-            print(f"[Error] {e}")
-
-
-class TitleBar(QFrame):
-    """Custom draggable title bar with buttons."""
-    def __init__(self, parent):
-        super().__init__()
-        self.parent = parent
-        self.setFixedHeight(40)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 0, 0, 0)
-        layout.setSpacing(0)
-
-        self.title_label = QLabel("Kongsberg Portal")
-        layout.addWidget(self.title_label)
-        layout.addStretch()
-
-        self.btn_min = QPushButton("–")
-        self.btn_close = QPushButton("×")
-        self.btn_close.setObjectName("close")
-
-        layout.addWidget(self.btn_min)
-        layout.addWidget(self.btn_close)
-
-        self.btn_min.clicked.connect(lambda: parent.showMinimized())
-        self.btn_close.clicked.connect(lambda: parent.close())
-
-        self.start_pos = QPoint()
-        self.is_dragging = False
-
-    def toggle_max_restore(self):
-        if self.parent.isMaximized():
-            self.parent.showNormal()
-        else:
-            self.parent.showMaximized()
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.start_pos = event.globalPosition().toPoint()
-            self.is_dragging = True
-
-    def mouseMoveEvent(self, event):
-        if self.is_dragging and not self.parent.isMaximized():
-            diff = event.globalPosition().toPoint() - self.start_pos
-            self.parent.move(self.parent.pos() + diff)
-            self.start_pos = event.globalPosition().toPoint()
-
-    def mouseReleaseEvent(self, event):
-        self.is_dragging = False
-
-
-class AnimatedStack(QStackedWidget):
-    """Stacked widget with slide transition animation."""
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.anim = QPropertyAnimation(self, b"geometry")
-        self.anim.setEasingCurve(QEasingCurve.OutCubic)
-        self.anim.setDuration(400)
-
-    def setCurrentIndexAnimated(self, index):
-        if index == self.currentIndex():
-            return
-
-        current_rect = self.geometry()
-        direction = 1 if index > self.currentIndex() else -1
-
-        next_rect = QRect(current_rect)
-        next_rect.moveLeft(current_rect.width() * direction)
-        self.widget(index).setGeometry(next_rect)
-        self.widget(index).show()
-
-        self.anim.stop()
-        self.anim.setStartValue(next_rect)
-        self.anim.setEndValue(current_rect)
-        self.anim.start()
 
-        self.setCurrentIndex(index)
+@lru_cache(maxsize=None)
+def _build_palette():
+    """Light QPalette matching the stylesheet; built once and shared."""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(_THEME["bg"]))
+    palette.setColor(QPalette.WindowText, QColor(_THEME["text"]))
+    palette.setColor(QPalette.Base, QColor(_THEME["panel"]))
+    palette.setColor(QPalette.AlternateBase, QColor(_THEME["table_alt"]))
+    palette.setColor(QPalette.ToolTipBase, QColor(_THEME["panel"]))
+    palette.setColor(QPalette.ToolTipText, QColor(_THEME["text"]))
+    palette.setColor(QPalette.Text, QColor(_THEME["text"]))
+    palette.setColor(QPalette.Button, QColor(_THEME["panel"]))
+    palette.setColor(QPalette.ButtonText, QColor(_THEME["text"]))
+    palette.setColor(QPalette.BrightText, QColor("#ffffff"))
+    palette.setColor(QPalette.Highlight, QColor(_THEME["accent"]))
+    palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
+    return palette
 
 
 class ModernWindow(QMainWindow):
@@ -316,6 +164,7 @@ class ModernWindow(QMainWindow):
 
         # Sidebar navigation
         nav = QFrame()
+        nav.setProperty("sidebar", True)  # styled by QFrame[sidebar="true"]
         nav.setFixedWidth(220)
 
         nav_layout = QVBoxLayout(nav)
@@ -345,10 +194,13 @@ class ModernWindow(QMainWindow):
         self.stack.addWidget(settings)
 
         # --- Connect buttons ---
-        self.btn_home.clicked.connect(lambda: self.stack.setCurrentIndexAnimated(0))
-        self.btn_production.clicked.connect(lambda: self.stack.setCurrentIndexAnimated(1))
-        self.btn_logistics.clicked.connect(lambda: self.stack.setCurrentIndexAnimated(2))
-        self.btn_settings.clicked.connect(lambda: self.stack.setCurrentIndexAnimated(3))
+        # Button ids match stack indices, so idClicked feeds the stack directly
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.addButton(self.btn_home, 0)
+        self.nav_group.addButton(self.btn_production, 1)
+        self.nav_group.addButton(self.btn_logistics, 2)
+        self.nav_group.addButton(self.btn_settings, 3)
+        self.nav_group.idClicked.connect(self.stack.setCurrentIndexAnimated)
 
         # Combine sidebar + pages
         central_layout.addWidget(nav)
@@ -364,7 +216,9 @@ class ModernWindow(QMainWindow):
         layout.setAlignment(Qt.AlignCenter)
 
         title_lbl = QLabel(title)
+        title_lbl.setProperty("role", "page-title")
         text_lbl = QLabel(text)
+        text_lbl.setProperty("role", "page-body")
         text_lbl.setWordWrap(True)
 
         layout.addWidget(title_lbl)
@@ -377,8 +231,15 @@ class ModernWindow(QMainWindow):
 
 
 if __name__ == "__main__":
+    # Let Qt coalesce bursts of mouse/tablet moves; must be set before the app exists
+    QCoreApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    QCoreApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("assets/icon.ico"))
+    # Light modern theme with blue accents
+    app.setStyle("Fusion")
+    app.setPalette(_build_palette())
+    app.setStyleSheet(_GLOBAL_STYLESHEET)
+    app.setWindowIcon(QIcon(":/assets/icon.ico"))
     window = ModernWindow()
     window.show()
     sys.exit(app.exec())
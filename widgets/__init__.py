@@ -0,0 +1,12 @@
+from .animated_stack import AnimatedStack
+from .data_widget import DataTable, JsonTableModel, QueryWorker, WorkerSignals
+from .titlebar import TitleBar
+
+__all__ = [
+    "AnimatedStack",
+    "DataTable",
+    "JsonTableModel",
+    "QueryWorker",
+    "TitleBar",
+    "WorkerSignals",
+]
@@ -0,0 +1,35 @@
+from PySide6.QtCore import QAbstractAnimation, QPropertyAnimation, QEasingCurve, QRect
+from PySide6.QtWidgets import QStackedWidget
+
+
+class AnimatedStack(QStackedWidget):
+    """Stacked widget with slide transition animation."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.anim = QPropertyAnimation(self, b"geometry")
+        self.anim.setEasingCurve(QEasingCurve.OutCubic)
+        self.anim.setDuration(400)
+
+    def setCurrentIndexAnimated(self, index):
+        if index == self.currentIndex():
+            return
+
+        if self.anim.state() == QAbstractAnimation.Running:
+            # Snap the in-flight slide to its final geometry so the new one
+            # starts from the resting rect rather than a mid-interpolation one
+            self.anim.stop()
+            self.setGeometry(self.anim.endValue())
+
+        current_rect = self.geometry()
+        direction = 1 if index > self.currentIndex() else -1
+
+        next_rect = QRect(current_rect)
+        next_rect.moveLeft(current_rect.width() * direction)
+        self.widget(index).setGeometry(next_rect)
+        self.widget(index).show()
+
+        self.anim.setStartValue(next_rect)
+        self.anim.setEndValue(current_rect)
+        self.anim.start()
+
+        self.setCurrentIndex(index)
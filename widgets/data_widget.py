@@ -0,0 +1,354 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson decodes large result sets several times faster than the stdlib parser
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# ijson lets large results be parsed and shown incrementally while they download
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, Signal, QAbstractTableModel, QModelIndex
+)
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableView,
+    QMessageBox, QButtonGroup, QHeaderView
+)
+
+# Shared keep-alive session so repeated queries reuse pooled connections to the
+# Node.js bridge instead of opening a new one per request. POST is retried only
+# when the request never reached the bridge (connection failure) or a gateway
+# answered 502/503/504; a read timeout means the query may still be running on
+# SQL Server, so it is never re-sent.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=0,
+        status=3,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+    ),
+))
+
+# Client-side cache of recent query results: (endpoint, query) -> (fetched_at, rows)
+_QUERY_CACHE = {}
+_QUERY_CACHE_TTL = 30  # seconds
+
+# Rows per batch handed to the UI while a result is streaming in
+_STREAM_CHUNK_ROWS = 1000
+# Responses with a known size below this are decoded in one go with orjson,
+# which beats incremental parsing when there is little to show early
+_STREAM_MIN_BYTES = 1 << 20
+
+
+def _not_rows_error(data):
+    return ValueError(f"Expected a JSON array of row objects, got: {str(data)[:200]}")
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by QueryWorker back to the UI thread.
+    chunk carries intermediate batches of rows; finished carries the last one.
+    """
+    chunk = Signal(list)
+    finished = Signal(list)
+    error = Signal(str)
+
+
+class QueryWorker(QRunnable):
+    """Runs a single query against the Node.js bridge off the UI thread."""
+    def __init__(self, endpoint, query, timeout=(2, 10)):
+        super().__init__()
+        self.endpoint = endpoint
+        self.query = query
+        self.timeout = timeout
+        self.signals = WorkerSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Ask a superseded worker to stop reading its response."""
+        self._cancelled.set()
+
+    def run(self):
+        try:
+            with _SESSION.post(self.endpoint, json={"query": self.query},
+                               timeout=self.timeout, stream=True) as res:
+                res.raise_for_status()
+                length = res.headers.get("Content-Length")
+                if _ijson is None or (length is not None and int(length) < _STREAM_MIN_BYTES):
+                    data = _json_loads(res.content)
+                    if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+                        raise _not_rows_error(data)
+                    batch = data
+                else:
+                    result = self._stream_rows(res)
+                    if result is None:
+                        return  # cancelled; leaving the block closes the response
+                    data, batch = result
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        if self._cancelled.is_set():
+            # Superseded (e.g. by a forced Refresh): don't let an older result
+            # overwrite the newer query's cache entry or reach the UI
+            return
+        _QUERY_CACHE[(self.endpoint, self.query)] = (time.monotonic(), data)
+        self.signals.finished.emit(batch)
+
+    def _stream_rows(self, res):
+        """
+        Parse the response array incrementally, emitting full batches as they
+        fill. Returns all rows and the trailing partial batch, or None if the
+        worker was cancelled part-way through.
+        """
+        data = []
+        batch = []
+        rows = _ijson.sendable_list()
+        # use_float keeps numbers identical to the orjson/json path (no Decimal)
+        parser = _ijson.items_coro(rows, "item", use_float=True)
+        head = b""
+        for raw in res.iter_content(chunk_size=64 * 1024):
+            if self._cancelled.is_set():
+                return None
+            if head is not None:
+                # Check the top-level value is an array before trusting "item"
+                # events; an object (e.g. an error payload) would yield nothing
+                head += raw
+                stripped = head.lstrip()
+                if not stripped:
+                    continue
+                if not stripped.startswith(b"["):
+                    raise _not_rows_error(head.decode(errors="replace"))
+                raw, head = head, None
+            parser.send(raw)
+            batch = self._take_rows(rows, batch, data)
+        if head is not None:
+            raise _not_rows_error(head.decode(errors="replace"))
+        parser.close()
+        batch = self._take_rows(rows, batch, data)
+        data.extend(batch)
+        return data, batch
+
+    def _take_rows(self, rows, batch, data):
+        """Move parsed rows into batch, emitting each batch once it is full."""
+        for row in rows:
+            if not isinstance(row, dict):
+                raise _not_rows_error(row)
+            batch.append(row)
+            if len(batch) == _STREAM_CHUNK_ROWS:
+                data.extend(batch)
+                self.signals.chunk.emit(batch)
+                batch = []
+        del rows[:]
+        return batch
+
+
+class JsonTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of JSON row dicts.
+    Cells are converted to text lazily, only when the view asks for them.
+    """
+    def __init__(self, rows=None, columns=None, parent=None):
+        super().__init__(parent)
+        self._rows = rows or []
+        self._columns = columns or []
+
+    def set_rows(self, rows, columns):
+        self.beginResetModel()
+        self._rows = list(rows)  # own copy: appends must not touch cached results
+        self._columns = columns
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._columns[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        # Only called for cells in the viewport, so str() cost scales with
+        # what is on screen rather than with the size of the result
+        value = self._rows[index.row()].get(self._columns[index.column()])
+        return "" if value is None else str(value)
+
+
+class DataTable(QWidget):
+    """
+    A single table widget that can run any SQL query
+    on-demand when a button is pressed.
+    """
+    def __init__(self, title="Data Viewer", endpoint="http://localhost:3000/query"):
+        super().__init__()
+        self.endpoint = endpoint
+        self._worker = None  # most recent (current) worker, cancelled when superseded
+        self._signals = None  # its signals object
+        self._receiving = False  # current worker has already delivered rows
+        self._last_query = None
+
+        # --- Layout setup ---
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(10)
+
+        # Title
+        title_label = QLabel(title)
+        layout.addWidget(title_label)
+
+        # Table
+        self.model = JsonTableModel()
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # Fixed/interactive sections so inserts never trigger a per-row or
+        # per-column remeasure; widths are fitted once per new result instead
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        layout.addWidget(self.table)
+
+        # Buttons row
+        button_layout = QHBoxLayout()
+        layout.addLayout(button_layout)
+
+        # Add buttons with predefined queries
+        self.buttons = {
+            "Drumming": "SELECT TOP 10 * FROM dbo.batches",
+            "Ewald": "SELECT TOP 10 * FROM dbo.ewald",
+            "Convo": "SELECT TOP 10 * FROM dbo.convo",
+            "Mixing": "SELECT TOP 10 * FROM dbo.Mixing",
+        }
+
+        # One group dispatches every query button by id, so no per-button
+        # Python closure sits between the click and run_query.
+        self._queries = list(self.buttons.values())
+        self.query_group = QButtonGroup(self)
+        for idx, label in enumerate(self.buttons):
+            btn = QPushButton(label)
+            self.query_group.addButton(btn, idx)
+            button_layout.addWidget(btn)
+        self.query_group.idClicked.connect(self._run_preset)
+
+        button_layout.addStretch()
+
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.setEnabled(False)  # nothing to refresh until a query has run
+        self.refresh_btn.clicked.connect(self.refresh)
+        button_layout.addWidget(self.refresh_btn)
+
+    def run_query(self, query: str, force: bool = False):
+        """
+        Fetch data from the Node.js bridge on a worker thread.
+        Results younger than _QUERY_CACHE_TTL are reused unless force is set.
+        """
+        self._last_query = query
+        # Any worker still in flight is now superseded; its slots check
+        # _is_current() so already-queued emissions from it are ignored
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._signals = None
+
+        if not force:
+            key = (self.endpoint, query)
+            hit = _QUERY_CACHE.get(key)
+            if hit and time.monotonic() - hit[0] < _QUERY_CACHE_TTL:
+                self.refresh_btn.setEnabled(True)
+                self._populate(hit[1])
+                return
+            if hit:
+                del _QUERY_CACHE[key]  # expired; don't keep large results around
+
+        worker = QueryWorker(self.endpoint, query)
+        worker.signals.chunk.connect(self._on_chunk)
+        worker.signals.finished.connect(self._on_finished)
+        worker.signals.error.connect(self._show_error)
+        # Keep the signals object alive until its queued emissions are delivered
+        self._worker = worker
+        self._signals = worker.signals
+        self._receiving = False
+        # Re-enabled once the result (or error) arrives, so repeated clicks
+        # can't stack up requests
+        self.refresh_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def _run_preset(self, idx: int):
+        self.run_query(self._queries[idx])
+
+    def refresh(self):
+        """Re-run the last query, bypassing the cache."""
+        if self._last_query is not None:
+            self.run_query(self._last_query, force=True)
+
+    def _is_current(self):
+        """True when the signal being handled comes from the latest worker."""
+        return self._signals is not None and self.sender() is self._signals
+
+    def _on_chunk(self, rows: list):
+        if self._is_current():
+            self._add_rows(rows)
+
+    def _on_finished(self, rows: list):
+        if not self._is_current():
+            return
+        # An empty final batch only matters if nothing arrived before it
+        if rows or not self._receiving:
+            self._add_rows(rows)
+        self.refresh_btn.setEnabled(True)
+
+    def _add_rows(self, rows: list):
+        """Replace the table with the first batch of a result, then append."""
+        if self._receiving:
+            self.model.append_rows(rows)
+        else:
+            self._receiving = True
+            self._populate(rows)
+
+    def _populate(self, data: list):
+        """Replace the table contents with the given rows."""
+        if not data:
+            self.model.set_rows([], ["No data"])
+        else:
+            self.model.set_rows(data, list(data[0].keys()))
+        self.table.resizeColumnsToContents()
+
+    def _show_error(self, message: str):
+        if not self._is_current():
+            return
+        self.refresh_btn.setEnabled(True)
+        if self._receiving:
+            # Don't leave a partially streamed result looking complete
+            self._receiving = False
+            self._populate([])
+        QMessageBox.critical(self, "Error", f"Failed to load data:\n{message}")
+        print(f"[Error] {message}")
@@ -0,0 +1,92 @@
+import time
+
+from PySide6.QtCore import Qt, QPoint, QTimer
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton
+
+
+class TitleBar(QFrame):
+    """Custom draggable title bar with buttons."""
+    MOVE_INTERVAL_NS = 8_000_000  # ~120 Hz
+
+    def __init__(self, parent):
+        super().__init__()
+        self.parent = parent
+        self.setObjectName("titlebar")
+        self.setFixedHeight(40)
+        # Dragging only needs moves while a button is held
+        self.setMouseTracking(False)
+        self.setAttribute(Qt.WA_AcceptTouchEvents, False)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(10, 0, 0, 0)
+        layout.setSpacing(0)
+
+        self.title_label = QLabel("Kongsberg Portal")
+        layout.addWidget(self.title_label)
+        layout.addStretch()
+
+        self.btn_min = QPushButton("–")
+        self.btn_close = QPushButton("×")
+        self.btn_close.setObjectName("close")
+
+        layout.addWidget(self.btn_min)
+        layout.addWidget(self.btn_close)
+
+        self.btn_min.clicked.connect(lambda: parent.showMinimized())
+        self.btn_close.clicked.connect(lambda: parent.close())
+
+        self.start_pos = QPoint()
+        self.is_dragging = False
+        self._last_move_ns = 0
+
+        # Applies motion held back by the throttle if no further move arrives
+        self._pending_pos = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.MOVE_INTERVAL_NS // 1_000_000)
+        self._flush_timer.timeout.connect(self._flush_drag)
+
+    def toggle_max_restore(self):
+        if self.parent.isMaximized():
+            self.parent.showNormal()
+        else:
+            self.parent.showMaximized()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.start_pos = event.globalPosition().toPoint()
+            self.is_dragging = True
+
+    def mouseMoveEvent(self, event):
+        if self.is_dragging and not self.parent.isMaximized():
+            # Reposition at most every ~8 ms; start_pos is left untouched on
+            # skipped events so their motion is carried into the next move.
+            pos = event.globalPosition().toPoint()
+            now = time.perf_counter_ns()
+            if now - self._last_move_ns < self.MOVE_INTERVAL_NS:
+                self._pending_pos = pos
+                if not self._flush_timer.isActive():
+                    self._flush_timer.start()
+                return
+            self._flush_timer.stop()
+            self._last_move_ns = now
+            self._apply_drag(pos)
+
+    def mouseReleaseEvent(self, event):
+        self._flush_timer.stop()
+        if self.is_dragging and not self.parent.isMaximized():
+            # Flush any motion held back by the throttle
+            self._apply_drag(event.globalPosition().toPoint())
+        self.is_dragging = False
+
+    def _flush_drag(self):
+        if self.is_dragging and self._pending_pos is not None:
+            self._last_move_ns = time.perf_counter_ns()
+            self._apply_drag(self._pending_pos)
+
+    def _apply_drag(self, pos):
+        self._pending_pos = None
+        diff = pos - self.start_pos
+        if not diff.isNull():
+            self.parent.move(self.parent.pos() + diff)
+        self.start_pos = pos